@@ -1,14 +1,16 @@
 """Core package for correcting SRT subtitle files against reference text."""
 
-from .models import SRTEntry
-from .parsing import parse_srt, write_srt
+from .models import NormalizedReference, SRTEntry
+from .parsing import iter_parse_srt, parse_srt, read_reference, write_srt
 from .matching import (
     normalize_for_matching,
+    normalize_reference,
     find_by_sliding_window,
     find_text_in_reference,
     map_normalized_to_original,
     extract_corrected_text,
 )
+from .cache import load_normalized_reference
 from .corrector import (
     correct_srt_entries,
     show_statistics,
@@ -17,9 +19,14 @@ from .corrector import (
 
 __all__ = [
     "SRTEntry",
+    "NormalizedReference",
+    "iter_parse_srt",
     "parse_srt",
+    "read_reference",
     "write_srt",
     "normalize_for_matching",
+    "normalize_reference",
+    "load_normalized_reference",
     "find_by_sliding_window",
     "find_text_in_reference",
     "map_normalized_to_original",
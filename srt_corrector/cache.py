@@ -0,0 +1,120 @@
+import hashlib
+import os
+import sys
+import unicodedata
+from array import array
+from itertools import pairwise
+from typing import Tuple
+
+from .matching import normalize_reference
+from .models import NormalizedReference
+
+# Bump when the layout of NormalizedReference or the normalization changes.
+_CACHE_VERSION = 3
+# Cached references kept on disk; the least recently used are removed first.
+_CACHE_MAX_ENTRIES = 8
+
+
+def _cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "srt_corrector")
+
+
+def _cache_key(reference_text: str) -> str:
+    digest = hashlib.blake2b(reference_text.encode("utf-8", "surrogatepass"), digest_size=20)
+    # str.isalnum()/lower() follow the interpreter's Unicode database, and the
+    # index file is written in native byte order and item size.
+    digest.update(unicodedata.unidata_version.encode("ascii"))
+    digest.update(f"{sys.byteorder}:{array('i').itemsize}".encode("ascii"))
+    return f"{digest.hexdigest()}.v{_CACHE_VERSION}"
+
+
+def _load(reference_text: str, text_path: str, index_path: str) -> Tuple[str, "array[int]"]:
+    with open(text_path, "rb") as f:
+        normalized = f.read().decode("utf-8")
+
+    norm_to_orig = array("i")
+    with open(index_path, "rb") as f:
+        norm_to_orig.fromfile(f, len(normalized))
+        if f.read(1):
+            raise ValueError("index file longer than the normalized text")
+
+    # Positions index reference_text later on, so a damaged index must not load.
+    if norm_to_orig and (
+        norm_to_orig[0] < 0
+        or norm_to_orig[-1] >= len(reference_text)
+        or any(a > b for a, b in pairwise(norm_to_orig))
+    ):
+        raise ValueError("index positions out of order or out of range")
+
+    return normalized, norm_to_orig
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _evict(cache_dir: str) -> None:
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(".idx"):
+            path = os.path.join(cache_dir, name)
+            entries.append((os.path.getmtime(path), name[: -len(".idx")]))
+
+    entries.sort(reverse=True)
+    for _, key in entries[_CACHE_MAX_ENTRIES:]:
+        for suffix in (".idx", ".txt"):
+            try:
+                os.remove(os.path.join(cache_dir, key + suffix))
+            except FileNotFoundError:
+                pass
+
+
+def load_normalized_reference(reference_text: str) -> NormalizedReference:
+    """
+    ``normalize_reference`` backed by an on-disk cache.
+
+    The normalized text and the raw ``norm_to_orig`` array are stored as
+    plain data files under ``$XDG_CACHE_HOME/srt_corrector`` (``~/.cache``
+    by default), keyed by a BLAKE2b hash of the reference, so repeated runs
+    against the same text skip the normalization pass. Only the most
+    recently used ``_CACHE_MAX_ENTRIES`` references are kept. Any cache
+    problem falls back to normalizing in memory.
+    """
+    cache_dir = _cache_dir()
+    key = _cache_key(reference_text)
+    text_path = os.path.join(cache_dir, key + ".txt")
+    index_path = os.path.join(cache_dir, key + ".idx")
+
+    try:
+        normalized, norm_to_orig = _load(reference_text, text_path, index_path)
+    except (OSError, EOFError, ValueError):
+        # Missing, truncated or unreadable entry; rebuild it below.
+        pass
+    else:
+        try:
+            # Marks the entry as recently used; a read-only cache still hits.
+            os.utime(index_path)
+        except OSError:
+            pass
+        return NormalizedReference(reference_text, normalized, norm_to_orig)
+
+    reference = normalize_reference(reference_text)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # The index goes last, so a half-written entry fails to load and is rebuilt.
+        _write_atomically(text_path, reference.normalized.encode("utf-8"))
+        _write_atomically(index_path, reference.norm_to_orig.tobytes())
+        _evict(cache_dir)
+    except OSError:
+        pass
+
+    return reference
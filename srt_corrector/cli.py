@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import sys
 
 from .corrector import (
@@ -7,7 +8,7 @@ from .corrector import (
     show_comparison_examples,
     show_statistics,
 )
-from .parsing import parse_srt, write_srt
+from .parsing import parse_srt, read_reference, write_srt
 
 
 def main(
@@ -16,6 +17,7 @@ def main(
     output_path: str | None = None,
     threshold: float = 0.65,
     use_fuzzy: bool = True,
+    workers: int = 1,
 ):
     """High-level workflow: read, correct, write."""
     if output_path is None:
@@ -33,13 +35,17 @@ def main(
 
     print(f"\n[2/4] 读取参考文本...")
     print(f"      路径: {txt_path}")
-    with open(txt_path, "r", encoding="utf-8") as f:
-        reference_text = f.read()
+    reference_text = read_reference(txt_path)
     print(f"      ✓ 读取 {len(reference_text):,} 字符")
 
     print(f"\n[3/4] 执行文本修正...")
     corrected_entries = correct_srt_entries(
-        srt_entries, reference_text, threshold, use_fuzzy
+        srt_entries,
+        reference_text,
+        threshold,
+        use_fuzzy,
+        workers,
+        cache_reference=not os.environ.get("SRT_CORRECTOR_NO_CACHE"),
     )
 
     print(f"\n[4/4] 保存修正结果...")
@@ -60,13 +66,19 @@ def run_cli(argv: list[str] | None = None):
     args = sys.argv[1:] if argv is None else argv
 
     if len(args) < 2:
-        print("用法: python -m srt_corrector <srt文件> <txt文件> [输出文件] [阈值] [模糊匹配]")
+        print(
+            "用法: python -m srt_corrector <srt文件> <txt文件> "
+            "[输出文件] [阈值] [模糊匹配] [进程数]"
+        )
         print("\n参数说明:")
         print("  srt文件     - 需要修正的SRT字幕文件")
         print("  txt文件     - 准确的参考文本文件")
         print("  输出文件    - 可选，默认为原文件名_corrected_fuzzy.srt")
         print("  阈值        - 可选，匹配置信度阈值(0.0-1.0)，默认0.65")
         print("  模糊匹配    - 可选，启用模糊匹配(true/false)，默认true")
+        print("  进程数      - 可选，并行匹配的进程数，0表示使用全部CPU，默认1")
+        print("\n环境变量:")
+        print("  SRT_CORRECTOR_NO_CACHE=1 - 不读写参考文本的磁盘缓存")
         print("\n特性:")
         print("  ✓ 三层匹配机制：精确锚点 → 缩短锚点 → 模糊匹配")
         print("  ✓ 处理首词拼写错误（如 'Waz' → 'Woz'）")
@@ -76,6 +88,7 @@ def run_cli(argv: list[str] | None = None):
         print("  python -m srt_corrector 'audio.srt' 'reference.txt'")
         print("  python -m srt_corrector 'audio.srt' 'reference.txt' 'output.srt' 0.7")
         print("  python -m srt_corrector 'audio.srt' 'reference.txt' 'output.srt' 0.65 false")
+        print("  python -m srt_corrector 'audio.srt' 'reference.txt' 'output.srt' 0.65 true 0")
         sys.exit(1)
 
     srt_file = args[0]
@@ -83,8 +96,11 @@ def run_cli(argv: list[str] | None = None):
     output_file = args[2] if len(args) > 2 else None
     threshold = float(args[3]) if len(args) > 3 else 0.65
     use_fuzzy_match = args[4].lower() != "false" if len(args) > 4 else True
+    workers = int(args[5]) if len(args) > 5 else 1
+    if workers <= 0:
+        workers = os.cpu_count() or 1
 
-    main(srt_file, txt_file, output_file, threshold, use_fuzzy_match)
+    main(srt_file, txt_file, output_file, threshold, use_fuzzy_match, workers)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,152 @@
-from typing import List
-
-from .matching import extract_corrected_text, find_text_in_reference
-from .models import SRTEntry
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from .cache import load_normalized_reference
+from .matching import (
+    extract_corrected_text,
+    find_text_in_reference,
+    normalize_for_matching,
+    normalize_reference,
+)
+from .models import NormalizedReference, SRTEntry
+
+# (corrected text or None, score, method, hint for the next entry)
+MatchResult = Tuple[Optional[str], float, str, int]
+
+# Minimum entries between progress updates; large files update every 1%.
+_PROGRESS_INTERVAL = 32
+
+_worker_reference: Optional[NormalizedReference] = None
+
+
+def _match_entry(
+    text: str,
+    reference: NormalizedReference,
+    start_hint: int,
+    confidence_threshold: float,
+    use_fuzzy: bool,
+) -> MatchResult:
+    """Match one entry; the hint only advances when the entry is corrected."""
+    norm_start, norm_end, score, method = find_text_in_reference(
+        text, reference, start_hint, use_fuzzy=use_fuzzy
+    )
+    result: MatchResult = None, score, method, start_hint
+
+    if score >= confidence_threshold and norm_start != -1:
+        corrected = extract_corrected_text(reference, norm_start, norm_end)
+        if corrected and len(corrected.strip()) > 0:
+            result = corrected, score, method, norm_end
+
+    return result
+
+
+def _estimate_start_hint(texts: List[str], reference: NormalizedReference, default: int) -> int:
+    """Guess where a chunk starts from the first entry that occurs verbatim exactly once."""
+    ref_normalized = reference.normalized
+    offset = 0
+
+    for text in texts[:5]:
+        normalized = normalize_for_matching(text)
+        if not normalized:
+            continue
+        pos = ref_normalized.find(normalized)
+        if pos != -1 and ref_normalized.find(normalized, pos + 1) == -1:
+            return max(0, pos - offset)
+        offset += len(normalized) + 1
+
+    return default
+
+
+def _init_worker(reference_text: str, cache_reference: bool) -> None:
+    """Build the worker's own normalized reference once per process."""
+    global _worker_reference
+    if cache_reference:
+        _worker_reference = load_normalized_reference(reference_text)
+    else:
+        _worker_reference = normalize_reference(reference_text)
+
+
+def _match_chunk(
+    texts: List[str], default_hint: int, confidence_threshold: float, use_fuzzy: bool
+) -> Tuple[int, List[MatchResult]]:
+    """Worker task: match a contiguous run of entries from an estimated hint."""
+    reference = _worker_reference
+    assert reference is not None, "worker started without _init_worker"
+    # The first chunk starts where a sequential run does.
+    start_hint = _estimate_start_hint(texts, reference, default_hint) if default_hint else 0
+
+    results = []
+    hint = start_hint
+    for text in texts:
+        result = _match_entry(text, reference, hint, confidence_threshold, use_fuzzy)
+        hint = result[3]
+        results.append(result)
+
+    return start_hint, results
+
+
+def _iter_matches(
+    texts: List[str],
+    reference: NormalizedReference,
+    confidence_threshold: float,
+    use_fuzzy: bool,
+) -> Iterator[MatchResult]:
+    """Match entries one after another, feeding each hint to the next entry."""
+    hint = 0
+    for text in texts:
+        result = _match_entry(text, reference, hint, confidence_threshold, use_fuzzy)
+        hint = result[3]
+        yield result
+
+
+def _iter_matches_parallel(
+    texts: List[str],
+    reference: NormalizedReference,
+    confidence_threshold: float,
+    use_fuzzy: bool,
+    workers: int,
+    cache_reference: bool,
+) -> Iterator[MatchResult]:
+    """
+    Match contiguous chunks in worker processes, then stitch them in order.
+
+    Each chunk runs speculatively from an estimated hint. A result depends
+    only on (text, hint), so while stitching, entries are re-matched locally
+    from the true hint until it agrees with the speculative one; from there
+    on the worker results are identical to a sequential run.
+    """
+    num_chunks = min(workers * 4, max(1, len(texts) // 25))
+    chunk_size = -(-len(texts) // num_chunks)
+    starts = range(0, len(texts), chunk_size)
+    ref_len = len(reference.normalized)
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(reference.text, cache_reference)
+    ) as executor:
+        futures = [
+            executor.submit(
+                _match_chunk,
+                texts[start : start + chunk_size],
+                ref_len * start // len(texts),
+                confidence_threshold,
+                use_fuzzy,
+            )
+            for start in starts
+        ]
+
+        hint = 0
+        for start, future in zip(starts, futures, strict=True):
+            speculative_hint, results = future.result()
+            for offset, speculative in enumerate(results):
+                result = speculative
+                if hint != speculative_hint:
+                    result = _match_entry(
+                        texts[start + offset], reference, hint, confidence_threshold, use_fuzzy
+                    )
+                speculative_hint = speculative[3]
+                hint = result[3]
+                yield result
 
 
 def correct_srt_entries(
@@ -9,44 +154,66 @@ def correct_srt_entries(
     reference_text: str,
     confidence_threshold: float = 0.65,
     use_fuzzy: bool = True,
+    workers: int = 1,
+    cache_reference: bool = False,
 ) -> List[SRTEntry]:
-    """Correct all SRT entries using the reference text."""
+    """
+    Correct all SRT entries using the reference text.
+
+    With ``workers > 1`` the matching runs in that many processes; the
+    result is the same as a sequential run. ``cache_reference`` keeps the
+    normalized reference on disk between runs (see
+    ``load_normalized_reference``).
+    """
     print("\n开始修正字幕...")
     print(f"匹配阈值: {confidence_threshold}")
     print(f"模糊匹配: {'启用' if use_fuzzy else '禁用'}")
 
-    corrected_count = 0
-    fuzzy_count = 0
-    ref_position_hint = 0
-
-    for i, entry in enumerate(srt_entries):
-        if (i + 1) % 10 == 0:
-            print(
-                f"进度: {i+1}/{len(srt_entries)} "
-                f"({100*(i+1)//len(srt_entries)}%)",
-                end="\r",
-            )
-
-        norm_start, norm_end, score, method = find_text_in_reference(
-            entry.text, reference_text, ref_position_hint, use_fuzzy=use_fuzzy
+    if cache_reference:
+        reference = load_normalized_reference(reference_text)
+    else:
+        reference = normalize_reference(reference_text)
+    texts = [entry.text for entry in srt_entries]
+    if workers > 1 and len(texts) >= 50:
+        print(f"并行进程: {workers}")
+        matches = _iter_matches_parallel(
+            texts, reference, confidence_threshold, use_fuzzy, workers, cache_reference
         )
+    else:
+        matches = _iter_matches(texts, reference, confidence_threshold, use_fuzzy)
 
-        if score >= confidence_threshold and norm_start != -1:
-            corrected = extract_corrected_text(reference_text, norm_start, norm_end)
-
-            if corrected and len(corrected.strip()) > 0:
-                entry.text = corrected
-                ref_position_hint = norm_end
-                corrected_count += 1
-
-                if method == "fuzzy":
-                    fuzzy_count += 1
-
-                if method == "fuzzy" and entry.text != entry.original_text:
-                    print(f"\n\n🔍 模糊匹配成功 - 字幕 #{entry.index}:")
-                    print(f"  原文: {entry.original_text[:70]}")
-                    print(f"  修正: {entry.text[:70]}")
-                    print(f"  置信度: {score:.2%}")
+    corrected_count = 0
+    fuzzy_count = 0
+    fuzzy_examples = []
+    total = len(srt_entries)
+    progress_every = max(_PROGRESS_INTERVAL, total // 100)
+    next_progress = progress_every
+
+    # strict=True also runs the match generator to its end, which closes
+    # the worker pool of the parallel path as soon as the last entry is in.
+    paired = zip(srt_entries, matches, strict=True)
+    for i, (entry, (corrected, score, method, _)) in enumerate(paired, 1):
+        if i == next_progress:
+            next_progress += progress_every
+            sys.stdout.write(f"进度: {i}/{total} ({100*i//total}%)\r")
+            sys.stdout.flush()
+
+        if corrected is not None:
+            entry.text = corrected
+            corrected_count += 1
+
+            if method == "fuzzy":
+                fuzzy_count += 1
+
+            if method == "fuzzy" and entry.text != entry.original_text:
+                fuzzy_examples.append((entry, score))
+
+    # Reported after the loop so they do not break up the progress line.
+    for entry, score in fuzzy_examples:
+        print(f"\n\n🔍 模糊匹配成功 - 字幕 #{entry.index}:")
+        print(f"  原文: {entry.original_text[:70]}")
+        print(f"  修正: {entry.text[:70]}")
+        print(f"  置信度: {score:.2%}")
 
     print(f"\n\n修正完成: {corrected_count}/{len(srt_entries)} 条字幕被修正")
     if use_fuzzy and fuzzy_count > 0:
@@ -1,13 +1,156 @@
 import re
-from difflib import SequenceMatcher
-from typing import Tuple
+from array import array
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
+from .models import NormalizedReference
 
+
+class _NormalizationTable(dict):
+    """
+    ``str.translate`` table: lowercase word characters, keep whitespace,
+    drop everything else. Non-ASCII code points are classified on first use.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
+        if char.isalnum() or char == "_":
+            value = char.lower()
+        elif char.isspace():
+            value = char
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+_NORM_TABLE = _NormalizationTable()
+_BLANK_LINES_RE = re.compile(r"\n\n+")
+
+# Punctuation pulled into a match span by _expand_bounds: any run of
+# commas/dashes/opening quotes, then at most one terminator and closing
+# quote in either order.
+_SENTENCE_TERMINATORS = ".!?:;"
+_CLOSING_QUOTES = '"\u201d\u2019'
+_OTHER_PUNCT = ",—–-\u201c\u2018'"
+_TRAILING_PUNCT_RE = re.compile(
+    "[{o}]*(?:[{t}][{c}]?|[{c}][{t}]?)?".format(
+        o=re.escape(_OTHER_PUNCT),
+        t=re.escape(_SENTENCE_TERMINATORS),
+        c=re.escape(_CLOSING_QUOTES),
+    )
+)
+_QUOTE_CHARS = frozenset('"\'\u201c\u201d\u2018\u2019')
+
+
+@lru_cache(maxsize=4096)
 def normalize_for_matching(text: str) -> str:
     """Normalize text for matching (letters, digits, and spaces only)."""
-    text = re.sub(r"[^\w\s]", "", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.lower().strip()
+    return " ".join(text.translate(_NORM_TABLE).split())
+
+
+def normalize_reference(reference_text: str) -> NormalizedReference:
+    """
+    Normalize the reference text in a single pass.
+
+    Produces the same string as ``normalize_for_matching`` together with the
+    original index of every normalized character, so the whole reference is
+    only scanned once per run instead of once per subtitle entry.
+    """
+    normalized_chars: List[str] = []
+    norm_to_orig = array("i")
+    pending_space = -1
+
+    for orig_idx, char in enumerate(reference_text):
+        if char.isalnum() or char == "_":
+            if pending_space != -1 and normalized_chars:
+                normalized_chars.append(" ")
+                norm_to_orig.append(pending_space)
+            pending_space = -1
+            for lowered in char.lower():
+                normalized_chars.append(lowered)
+                norm_to_orig.append(orig_idx)
+        elif char.isspace() and pending_space == -1:
+            pending_space = orig_idx
+
+    normalized = "".join(normalized_chars)
+    return NormalizedReference(reference_text, normalized, norm_to_orig)
+
+
+class _LCSPattern:
+    """
+    Bit masks of a fixed query string for repeated LCS ratio computations.
+
+    Scores use the Indel similarity ``2 * LCS / (len(a) + len(b))`` computed
+    with the bit-parallel LCS recurrence (Hyyrö), so each character of the
+    other string costs a handful of integer operations instead of a
+    Python-level DP row. Building the masks once per query lets every
+    candidate window reuse them.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.length = len(text)
+        self.masks: Dict[str, int] = {}
+        bit = 1
+        for char in text:
+            self.masks[char] = self.masks.get(char, 0) | bit
+            bit <<= 1
+        self.full = bit - 1
+
+    def ratio(self, other: str, score_cutoff: float = 0.0) -> float:
+        """
+        Similarity to ``other`` in the range 0.0-1.0.
+
+        Returns 0.0 without running the LCS when the length bound alone
+        shows the score must stay below ``score_cutoff``.
+        """
+        if other == self.text:
+            return 1.0
+        other_len = len(other)
+        total = self.length + other_len
+        if score_cutoff > 0.0 and 2 * min(self.length, other_len) < score_cutoff * total:
+            return 0.0
+
+        full = self.full
+        state = full
+        get_mask = self.masks.get
+        for char in other:
+            matched = state & get_mask(char, 0)
+            if matched:
+                state = ((state + matched) | (state - matched)) & full
+
+        lcs = self.length - state.bit_count()
+        return 2.0 * lcs / total
+
+    def best_prefix(self, other: str, min_len: int) -> Tuple[int, float]:
+        """
+        Best-scoring prefix of ``other`` that is at least ``min_len`` long.
+
+        A single pass of the LCS recurrence gives the LCS of every prefix, so
+        all candidate lengths are scored together. Returns (length, ratio) of
+        the shortest best prefix, or (0, 0.0) if none scores above zero.
+        """
+        length = self.length
+        full = self.full
+        state = full
+        get_mask = self.masks.get
+        best_len = 0
+        best_ratio = 0.0
+
+        for prefix_len, char in enumerate(other, 1):
+            matched = state & get_mask(char, 0)
+            if matched:
+                state = ((state + matched) | (state - matched)) & full
+            # Without a new match the LCS is unchanged and the ratio only drops.
+            if prefix_len >= min_len and (matched or prefix_len == min_len):
+                ratio = 2.0 * (length - state.bit_count()) / (length + prefix_len)
+                if ratio > best_ratio:
+                    best_ratio = ratio
+                    best_len = prefix_len
+
+        return best_len, best_ratio
 
 
 def find_by_sliding_window(
@@ -32,9 +175,40 @@ def find_by_sliding_window(
     else:
         window_size = int(srt_len * 1.15)
 
-    for i in range(0, len(search_region) - srt_len + 1, step):
-        window = search_region[i : i + window_size]
-        score = SequenceMatcher(None, srt_normalized, window).ratio()
+    srt_pattern = _LCSPattern(srt_normalized)
+    srt_counts = Counter(srt_normalized)
+
+    # Character counts of the current window and how many of them the query
+    # can pair up with, updated incrementally as the window slides.
+    window_counts: Counter[str] = Counter()
+    shared = 0
+    window_end = 0
+    region_len = len(search_region)
+
+    for i in range(0, region_len - srt_len + 1, step):
+        if i:
+            for char in search_region[i - step : i]:
+                window_counts[char] -= 1
+                if window_counts[char] < srt_counts[char]:
+                    shared -= 1
+        new_end = min(i + window_size, region_len)
+        for char in search_region[window_end:new_end]:
+            if window_counts[char] < srt_counts[char]:
+                shared += 1
+            window_counts[char] += 1
+        window_end = new_end
+
+        window_len = window_end - i
+        total = srt_len + window_len
+
+        # Cheap upper bounds on the LCS ratio: by length, then by shared
+        # characters. Windows that cannot beat the current best are skipped.
+        if 2 * min(srt_len, window_len) <= best_score * total:
+            continue
+        if 2 * shared <= best_score * total:
+            continue
+
+        score = srt_pattern.ratio(search_region[i:window_end])
 
         if score > best_score:
             best_score = score
@@ -49,32 +223,173 @@ def find_by_sliding_window(
     return -1, 0.0
 
 
+def _find_anchor_positions(
+    reference: NormalizedReference, anchor: str, search_start: int, search_end: int
+) -> List[int]:
+    """
+    Occurrences of ``anchor`` within ``normalized[search_start:search_end]``.
+
+    Uses bounded ``str.find`` on the reference itself, so no region slice is
+    built. Positions are relative to ``search_start``.
+    """
+    ref_normalized = reference.normalized
+    all_positions = []
+    pos = ref_normalized.find(anchor, search_start, search_end)
+    while pos != -1:
+        all_positions.append(pos - search_start)
+        pos = ref_normalized.find(anchor, pos + 1, search_end)
+    return all_positions
+
+
+def _pick_anchor_position(
+    srt_pattern: _LCSPattern,
+    ref_normalized: str,
+    all_positions: List[int],
+    search_start: int,
+    start_hint: int,
+) -> int:
+    """
+    Choose among anchor hits (relative to ``search_start``); -1 if none.
+
+    The best-scoring hit wins; hits within 0.01 of it are tie-broken by
+    distance to ``start_hint``.
+    """
+    if len(all_positions) <= 1:
+        return all_positions[0] if all_positions else -1
+
+    srt_len = srt_pattern.length
+    compare_len = max(srt_len, 50) if srt_len < 10 else srt_len
+    hint_rel = start_hint - search_start
+
+    best_score = 0.0
+    best_pos = all_positions[0]
+    best_distance = best_pos - hint_rel if best_pos >= hint_rel else hint_rel - best_pos
+
+    for pos in all_positions:
+        test_start = search_start + pos
+        score = srt_pattern.ratio(
+            ref_normalized[test_start : test_start + compare_len], best_score - 0.01
+        )
+        distance = pos - hint_rel if pos >= hint_rel else hint_rel - pos
+
+        if score > best_score + 0.01:
+            best_score = score
+            best_pos = pos
+            best_distance = distance
+        elif score >= best_score - 0.01 and distance < best_distance:
+            best_score = score
+            best_pos = pos
+            best_distance = distance
+
+    return best_pos
+
+
+def _boundary_score(
+    srt_pattern: _LCSPattern, ref_normalized: str, start: int, end: int
+) -> float:
+    """Similarity of ``ref_normalized[start:end]``, nudged towards word starts."""
+    ratio = srt_pattern.ratio(ref_normalized[start:end])
+    if start == 0 or ref_normalized[start - 1].isspace():
+        ratio += 0.02
+    return ratio
+
+
+def _refine_boundaries(
+    srt_pattern: _LCSPattern,
+    ref_normalized: str,
+    start: int,
+    end: int,
+    min_start: int,
+    max_start: int,
+    min_len: int,
+    max_len: int,
+    flexity: int,
+) -> Tuple[int, int, float]:
+    """
+    Tune a coarse fuzzy hit by moving one boundary at a time.
+
+    For each step size up to ``flexity`` the left and right boundaries are
+    shifted in both directions and a move is kept only when it improves the
+    score. Sweeps repeat until nothing improves, so the cost is a few rounds
+    of ``4 * flexity`` comparisons instead of a full start x length grid.
+
+    Candidates stay inside the same box as the old exhaustive grid: starts
+    in [``min_start``, ``max_start``) and lengths in [``min_len``,
+    ``max_len``]. The length band also caps the useful shift size.
+    Successive sweeps revisit many of the same spans, so scores are
+    memoized per call. Returns (start, end, score).
+    """
+    ref_len = len(ref_normalized)
+    flexity = min(flexity, max_len - min_len + 1)
+    end = min(end, ref_len)
+    best_ratio = _boundary_score(srt_pattern, ref_normalized, start, end)
+    scores = {(start, end): best_ratio}
+
+    improved = True
+    while improved:
+        improved = False
+        for shift in range(1, flexity):
+            for test_start, test_end in (
+                (start - shift, end),
+                (start + shift, end),
+                (start, end - shift),
+                (start, end + shift),
+            ):
+                if not (min_start <= test_start < max_start and test_start < test_end <= ref_len):
+                    continue
+                if not min_len <= test_end - test_start <= max_len:
+                    continue
+
+                span = (test_start, test_end)
+                ratio = scores.get(span)
+                if ratio is None:
+                    ratio = _boundary_score(srt_pattern, ref_normalized, test_start, test_end)
+                    scores[span] = ratio
+                if ratio > best_ratio:
+                    best_ratio = ratio
+                    start = test_start
+                    end = test_end
+                    improved = True
+
+    return start, end, best_ratio
+
+
 def find_text_in_reference(
-    srt_text: str, reference_text: str, start_hint: int = 0, use_fuzzy: bool = True
+    srt_text: str,
+    reference: NormalizedReference,
+    start_hint: int = 0,
+    use_fuzzy: bool = True,
 ) -> Tuple[int, int, float, str]:
     """
-    Find SRT text inside reference text using layered matching.
+    Find SRT text inside the normalized reference using layered matching.
 
-    Returns (start, end, score, method).
+    Returns (start, end, score, method); positions index ``reference.normalized``.
     """
-    srt_normalized = normalize_for_matching(srt_text)
-    ref_normalized = normalize_for_matching(reference_text)
+    ref_normalized = reference.normalized
+    if not ref_normalized or not srt_text or srt_text.isspace():
+        return -1, -1, 0.0, "none"
 
+    srt_normalized = normalize_for_matching(srt_text)
     if not srt_normalized:
         return -1, -1, 0.0, "none"
 
-    srt_words = srt_normalized.split()
-    if len(srt_words) == 0:
-        return -1, -1, 0.0, "none"
+    srt_len = len(srt_normalized)
+    ref_len = len(ref_normalized)
 
-    if len(srt_normalized) < 20:
+    if srt_len < 20:
         search_start = max(0, start_hint - 50)
-        search_end = min(len(ref_normalized), start_hint + 200)
+        search_end = min(ref_len, start_hint + 200)
     else:
         search_start = max(0, start_hint - 100)
-        search_end = min(len(ref_normalized), start_hint + 500)
+        search_end = min(ref_len, start_hint + 500)
 
-    search_region = ref_normalized[search_start:search_end]
+    # A line that occurs verbatim exactly once in the window needs no scoring.
+    exact = ref_normalized.find(srt_normalized, search_start, search_end)
+    if exact != -1 and ref_normalized.find(srt_normalized, exact + 1, search_end) == -1:
+        return exact, exact + srt_len, 1.0, "exact"
+
+    srt_words = srt_normalized.split()
+    srt_pattern = _LCSPattern(srt_normalized)
 
     num_anchor_words = min(5, max(2, len(srt_words) // 3))
     start_anchor = " ".join(srt_words[:num_anchor_words])
@@ -85,132 +400,55 @@ def find_text_in_reference(
     )
 
     if num_anchor_words <= 3:
-        all_positions = []
-        pos = 0
-        while True:
-            pos = search_region.find(start_anchor, pos)
-            if pos == -1:
-                break
-            all_positions.append(pos)
-            pos += 1
-
-        if len(all_positions) == 0:
-            start_pos = -1
-        elif len(all_positions) == 1:
-            start_pos = all_positions[0]
-        else:
-            best_score = 0
-            best_pos = all_positions[0]
-            compare_len = (
-                max(len(srt_normalized), 50)
-                if len(srt_normalized) < 10
-                else len(srt_normalized)
-            )
+        all_positions = _find_anchor_positions(
+            reference, start_anchor, search_start, search_end
+        )
 
-            for pos in all_positions:
-                test_start = search_start + pos
-                test_end = min(test_start + compare_len, len(ref_normalized))
-                test_text = ref_normalized[test_start:test_end]
-                score = SequenceMatcher(None, srt_normalized, test_text).ratio()
-
-                if score > best_score + 0.01:
-                    best_score = score
-                    best_pos = pos
-                elif abs(score - best_score) <= 0.01:
-                    current_distance = abs(test_start - start_hint)
-                    best_distance = abs(search_start + best_pos - start_hint)
-                    if current_distance < best_distance:
-                        best_score = score
-                        best_pos = pos
-
-            start_pos = best_pos
+        start_pos = _pick_anchor_position(
+            srt_pattern, ref_normalized, all_positions, search_start, start_hint
+        )
     else:
-        start_pos = search_region.find(start_anchor)
+        all_positions = _find_anchor_positions(
+            reference, start_anchor, search_start, search_end
+        )
+        start_pos = all_positions[0] if all_positions else -1
 
     method = "exact"
 
     if start_pos == -1:
         start_anchor = " ".join(srt_words[:2])
-        all_positions = []
-        pos = 0
-        while True:
-            pos = search_region.find(start_anchor, pos)
-            if pos == -1:
-                break
-            all_positions.append(pos)
-            pos += 1
+        all_positions = _find_anchor_positions(
+            reference, start_anchor, search_start, search_end
+        )
 
         if len(all_positions) > 0:
-            if len(all_positions) == 1:
-                start_pos = all_positions[0]
-            else:
-                best_score = 0
-                best_pos = all_positions[0]
-                compare_len = (
-                    max(len(srt_normalized), 50)
-                    if len(srt_normalized) < 10
-                    else len(srt_normalized)
-                )
-
-                for pos in all_positions:
-                    test_start = search_start + pos
-                    test_end = min(test_start + compare_len, len(ref_normalized))
-                    test_text = ref_normalized[test_start:test_end]
-                    score = SequenceMatcher(None, srt_normalized, test_text).ratio()
-
-                    if score > best_score + 0.01:
-                        best_score = score
-                        best_pos = pos
-                    elif abs(score - best_score) <= 0.01:
-                        current_distance = abs(test_start - start_hint)
-                        best_distance = abs(search_start + best_pos - start_hint)
-                        if current_distance < best_distance:
-                            best_score = score
-                            best_pos = pos
-
-                start_pos = best_pos
-
+            start_pos = _pick_anchor_position(
+                srt_pattern, ref_normalized, all_positions, search_start, start_hint
+            )
             method = "short"
 
     if start_pos == -1 and use_fuzzy:
+        fuzzy_threshold = 0.80
         fuzzy_pos, fuzzy_score = find_by_sliding_window(
-            srt_normalized, search_region, fuzzy_threshold=0.80
+            srt_normalized,
+            ref_normalized[search_start:search_end],
+            fuzzy_threshold=fuzzy_threshold,
         )
 
         if fuzzy_pos != -1:
             method = "fuzzy"
             abs_start = search_start + fuzzy_pos
-            best_ratio = 0
-            best_start = abs_start
-            best_end = abs_start + len(srt_normalized)
-
-            search_window_start = max(abs_start - 30, search_start)
-            search_window_end = min(abs_start + 60, search_start + len(search_region))
-
-            for test_start in range(search_window_start, search_window_end):
-                min_len = int(len(srt_normalized) * 0.9)
-                max_len = int(len(srt_normalized) * 1.1)
-
-                for test_len in range(
-                    min_len, min(max_len + 1, len(ref_normalized) - test_start + 1)
-                ):
-                    test_end = test_start + test_len
-                    if test_end > len(ref_normalized):
-                        break
-
-                    test_text = ref_normalized[test_start:test_end]
-                    ratio = SequenceMatcher(None, srt_normalized, test_text).ratio()
-                    at_word_boundary = test_start == 0 or ref_normalized[
-                        test_start - 1
-                    ].isspace()
-
-                    if at_word_boundary:
-                        ratio += 0.02
-
-                    if ratio > best_ratio:
-                        best_ratio = ratio
-                        best_start = test_start
-                        best_end = test_end
+            best_start, best_end, best_ratio = _refine_boundaries(
+                srt_pattern,
+                ref_normalized,
+                abs_start,
+                abs_start + srt_len,
+                min_start=max(search_start, abs_start - 30),
+                max_start=min(search_end, abs_start + 60),
+                min_len=int(srt_len * 0.9),
+                max_len=int(srt_len * 1.1),
+                flexity=max(30, srt_len // 10),
+            )
 
             return best_start, best_end, best_ratio, method
 
@@ -218,56 +456,32 @@ def find_text_in_reference(
         return -1, -1, 0.0, "none"
 
     abs_start = search_start + start_pos
-    max_search_length = len(srt_normalized) * 3
-    end_search_region = ref_normalized[abs_start : abs_start + max_search_length]
-
-    end_pos = end_search_region.find(end_anchor)
+    end_pos = ref_normalized.find(end_anchor, abs_start, abs_start + srt_len * 3)
     if end_pos == -1:
-        best_ratio = 0
-        best_end = abs_start + len(srt_normalized)
-        min_len = int(len(srt_normalized) * 0.8)
-        max_len = int(len(srt_normalized) * 1.5)
-
-        for test_len in range(
-            min_len, min(max_len, len(ref_normalized) - abs_start)
-        ):
-            test_text = ref_normalized[abs_start : abs_start + test_len]
-            ratio = SequenceMatcher(None, srt_normalized, test_text).ratio()
-
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_end = abs_start + test_len
-
-        abs_end = best_end
+        # Lengths from 0.8x up to (excluding) 1.5x the query, scored in one pass.
+        min_len = int(srt_len * 0.8)
+        max_len = min(int(srt_len * 1.5), ref_len - abs_start) - 1
+        best_len, _ = srt_pattern.best_prefix(
+            ref_normalized[abs_start : abs_start + max_len], min_len
+        )
+        abs_end = abs_start + (best_len or srt_len)
     else:
-        abs_end = abs_start + end_pos + len(end_anchor)
+        abs_end = end_pos + len(end_anchor)
 
     matched_text = ref_normalized[abs_start:abs_end]
-    score = SequenceMatcher(None, srt_normalized, matched_text).ratio()
+    score = srt_pattern.ratio(matched_text)
 
     return abs_start, abs_end, score, method
 
 
 def map_normalized_to_original(
-    norm_start: int, norm_end: int, reference_text: str
+    norm_start: int, norm_end: int, reference: NormalizedReference
 ) -> Tuple[int, int]:
     """
     Map normalized text positions back to original text positions.
     Preserves punctuation and quotes in the returned range.
     """
-    ref_normalized = normalize_for_matching(reference_text)
-    norm_to_orig = []
-    norm_idx = 0
-
-    for orig_idx, char in enumerate(reference_text):
-        if char.isalnum():
-            if norm_idx < len(ref_normalized) and char.lower() == ref_normalized[norm_idx]:
-                norm_to_orig.append(orig_idx)
-                norm_idx += 1
-        elif char.isspace():
-            if norm_idx < len(ref_normalized) and ref_normalized[norm_idx] == " ":
-                norm_to_orig.append(orig_idx)
-                norm_idx += 1
+    norm_to_orig = reference.norm_to_orig
 
     if norm_start >= len(norm_to_orig) or norm_end > len(norm_to_orig):
         return -1, -1
@@ -275,6 +489,16 @@ def map_normalized_to_original(
     orig_start = norm_to_orig[norm_start]
     orig_end = norm_to_orig[norm_end - 1] if norm_end > 0 else norm_to_orig[0]
 
+    return _expand_bounds(reference.text, orig_start, orig_end)
+
+
+def _expand_bounds(reference_text: str, orig_start: int, orig_end: int) -> Tuple[int, int]:
+    """
+    Grow the inclusive span [orig_start, orig_end] to whole words plus the
+    adjoining punctuation and quotes; returns an exclusive end.
+    """
+    last = len(reference_text) - 1
+
     while orig_start > 0 and reference_text[orig_start - 1].isalnum():
         orig_start -= 1
 
@@ -282,60 +506,30 @@ def map_normalized_to_original(
         orig_end -= 1
 
     if reference_text[orig_end].isalnum():
-        while orig_end < len(reference_text) - 1 and reference_text[
-            orig_end + 1
-        ].isalnum():
+        while orig_end < last and reference_text[orig_end + 1].isalnum():
             orig_end += 1
 
-    sentence_terminators = ".!?:;"
-    closing_quotes = '"\u201d\u2019'
-    other_punct = ",—–-\u201c\u2018'"
-
-    while orig_end < len(reference_text) - 1:
-        next_char = reference_text[orig_end + 1]
-
-        if next_char in sentence_terminators:
-            orig_end += 1
-            if orig_end < len(reference_text) - 1:
-                after_terminator = reference_text[orig_end + 1]
-                if after_terminator in closing_quotes:
-                    orig_end += 1
-            break
-        elif next_char in closing_quotes:
-            orig_end += 1
-            if orig_end < len(reference_text) - 1:
-                after_quote = reference_text[orig_end + 1]
-                if after_quote in sentence_terminators:
-                    orig_end += 1
-            break
-        elif next_char in other_punct:
-            orig_end += 1
-        elif next_char.isspace():
-            break
-        else:
-            break
+    # The pattern can match the empty string, so it always matches.
+    trailing = _TRAILING_PUNCT_RE.match(reference_text, orig_end + 1)
+    assert trailing is not None
+    orig_end = trailing.end() - 1
 
-    quote_chars = '"\'\u201c\u201d\u2018\u2019'
-    while orig_start > 0:
-        prev_char = reference_text[orig_start - 1]
-        if prev_char in quote_chars:
-            orig_start -= 1
-        else:
-            break
+    while orig_start > 0 and reference_text[orig_start - 1] in _QUOTE_CHARS:
+        orig_start -= 1
 
     return orig_start, orig_end + 1
 
 
-def extract_corrected_text(reference_text: str, norm_start: int, norm_end: int) -> str:
+def extract_corrected_text(
+    reference: NormalizedReference, norm_start: int, norm_end: int
+) -> str:
     """Extract corrected text from the reference string, preserving punctuation."""
-    orig_start, orig_end = map_normalized_to_original(
-        norm_start, norm_end, reference_text
-    )
+    orig_start, orig_end = map_normalized_to_original(norm_start, norm_end, reference)
 
     if orig_start == -1:
         return ""
 
-    extracted = reference_text[orig_start:orig_end].strip()
-    extracted = re.sub(r"\n\n+", "\n", extracted)
+    extracted = reference.text[orig_start:orig_end].strip()
+    extracted = _BLANK_LINES_RE.sub("\n", extracted)
 
     return extracted
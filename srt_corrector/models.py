@@ -1,8 +1,9 @@
+from array import array
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SRTEntry:
     """Single SRT subtitle entry."""
 
@@ -17,3 +18,12 @@ class SRTEntry:
 
     def __str__(self) -> str:
         return f"{self.index}\n{self.timestamp}\n{self.text}\n"
+
+
+@dataclass(slots=True)
+class NormalizedReference:
+    """Reference text normalized once, with a map back to original positions."""
+
+    text: str
+    normalized: str
+    norm_to_orig: "array[int]"
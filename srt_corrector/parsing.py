@@ -1,31 +1,73 @@
-import re
-from typing import List
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional
 
 from .models import SRTEntry
 
+# Read SRT files in large chunks so line iteration rarely hits the OS.
+_READ_BUFFER_SIZE = 1 << 20
+
+
+def _is_block_header(lines: List[str]) -> bool:
+    return len(lines) >= 2 and lines[0].strip().isdecimal() and "-->" in lines[1]
+
+
+def _iter_blocks(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the non-empty blocks between blank lines, without edge newlines."""
+    block: List[str] = []
+    for line in lines:
+        if line == "\n":
+            if block:
+                yield "".join(block).rstrip("\n")
+                block = []
+        else:
+            block.append(line)
+
+    if block:
+        yield "".join(block).rstrip("\n")
+
+
+def iter_parse_srt(srt_path: str) -> Iterator[SRTEntry]:
+    """
+    Parse an SRT file lazily, one entry at a time.
+
+    The file is read line by line. Blocks are separated by blank lines; a
+    block that does not start with an index and a timestamp line is a blank
+    line inside the previous entry's text and is appended to it, so each
+    entry is yielded once the next header (or the end of the file) is seen.
+    """
+    pending: Optional[List[str]] = None
+
+    with open(srt_path, "r", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as f:
+        first_line = next(f, "").lstrip("\ufeff")
+        for block in _iter_blocks(chain((first_line,), f)):
+            lines = block.split("\n", 2)
+            if _is_block_header(lines):
+                if pending is not None:
+                    yield SRTEntry(int(pending[0]), pending[1], pending[2].strip())
+                pending = [lines[0].strip(), lines[1], lines[2] if len(lines) > 2 else ""]
+            elif pending is not None:
+                pending[2] += "\n\n" + block
+
+    if pending is not None:
+        yield SRTEntry(int(pending[0]), pending[1], pending[2].strip())
+
 
 def parse_srt(srt_path: str) -> List[SRTEntry]:
     """Parse an SRT file into a list of entries."""
-    with open(srt_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    entries: List[SRTEntry] = []
-    pattern = (
-        r"(\d+)\n"
-        r"(\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3})\n"
-        r"((?:.*\n)*?)(?=\n\d+\n|\Z)"
-    )
-
-    for match in re.finditer(pattern, content, re.MULTILINE):
-        entries.append(
-            SRTEntry(
-                int(match.group(1)),
-                match.group(2),
-                match.group(3).strip(),
-            )
-        )
-
-    return entries
+    return list(iter_parse_srt(srt_path))
+
+
+def read_reference(txt_path: str) -> str:
+    """
+    Read the reference text as bytes and decode it in one go.
+
+    Works for regular files as well as pipes and process substitution;
+    newlines are translated the same way text-mode ``open`` would.
+    """
+    with open(txt_path, "rb") as f:
+        text = f.read().decode("utf-8")
+
+    return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
 def write_srt(entries: List[SRTEntry], output_path: str):
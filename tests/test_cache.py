@@ -0,0 +1,81 @@
+from array import array
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from srt_corrector import cache, load_normalized_reference, normalize_reference
+
+TEXT = "“Hello,” she said—twice.\n\nÉcole über_alles 42!"
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path / "srt_corrector"
+
+
+def test_round_trip_matches_normalize_reference(cache_dir: Path) -> None:
+    first = load_normalized_reference(TEXT)
+    assert sorted(p.suffix for p in cache_dir.iterdir()) == [".idx", ".txt"]
+
+    second = load_normalized_reference(TEXT)
+    assert second == first == normalize_reference(TEXT)
+
+
+@pytest.mark.parametrize("damage", [b"", b"\x00\x01", None])
+def test_damaged_index_is_rebuilt(cache_dir: Path, damage: Optional[bytes]) -> None:
+    load_normalized_reference(TEXT)
+    (index_path,) = cache_dir.glob("*.idx")
+    data = index_path.read_bytes()
+    index_path.write_bytes(data + b"\x00" * 4 if damage is None else damage)
+
+    assert load_normalized_reference(TEXT) == normalize_reference(TEXT)
+    assert index_path.read_bytes() == data
+
+
+@pytest.mark.parametrize("position", [-1, len(TEXT), 10**6])
+def test_index_with_out_of_range_positions_is_rebuilt(cache_dir: Path, position: int) -> None:
+    load_normalized_reference(TEXT)
+    (index_path,) = cache_dir.glob("*.idx")
+    data = index_path.read_bytes()
+    damaged = array("i", data)
+    damaged[len(damaged) // 2] = position
+    index_path.write_bytes(damaged.tobytes())
+
+    assert load_normalized_reference(TEXT) == normalize_reference(TEXT)
+    assert index_path.read_bytes() == data
+
+
+def test_index_out_of_order_is_rebuilt(cache_dir: Path) -> None:
+    load_normalized_reference(TEXT)
+    (index_path,) = cache_dir.glob("*.idx")
+    data = index_path.read_bytes()
+    damaged = array("i", data)
+    damaged[0], damaged[1] = damaged[1], damaged[0]
+    index_path.write_bytes(damaged.tobytes())
+
+    assert load_normalized_reference(TEXT) == normalize_reference(TEXT)
+    assert index_path.read_bytes() == data
+
+
+def test_read_only_cache_still_hits(cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    expected = load_normalized_reference(TEXT)
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise PermissionError("read-only cache")
+
+    monkeypatch.setattr(cache.os, "utime", fail)
+    monkeypatch.setattr(cache, "normalize_reference", None)
+    assert load_normalized_reference(TEXT) == expected
+
+
+def test_least_recently_used_entries_are_evicted(
+    cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(cache, "_CACHE_MAX_ENTRIES", 2)
+    for i in range(4):
+        load_normalized_reference(f"reference number {i}")
+
+    assert len(list(cache_dir.glob("*.idx"))) == 2
+    assert len(list(cache_dir.glob("*.txt"))) == 2
@@ -0,0 +1,45 @@
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from srt_corrector import SRTEntry, correct_srt_entries, corrector, normalize_reference, parse_srt
+from srt_corrector.corrector import MatchResult, _iter_matches, _iter_matches_parallel
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _texts(entries: List[SRTEntry]) -> List[str]:
+    return [entry.text for entry in entries]
+
+
+def test_parallel_output_matches_sequential_on_sample() -> None:
+    reference_text = (ROOT / "original03.txt").read_text(encoding="utf-8")
+    sequential = correct_srt_entries(parse_srt(str(ROOT / "raw03.srt")), reference_text)
+    parallel = correct_srt_entries(
+        parse_srt(str(ROOT / "raw03.srt")), reference_text, workers=3
+    )
+    assert _texts(parallel) == _texts(sequential)
+
+
+def test_parallel_stitch_repairs_misleading_chunk_hints(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The reference holds every line twice, so the per-chunk start estimates
+    # are ambiguous and the parent has to re-match chunk heads from the true
+    # hint before the speculative results line up again.
+    sentences = [f"Line number {i} says hello there." for i in range(120)]
+    reference = normalize_reference(" ".join(sentences * 2))
+    texts = [sentence.replace("hello", "helo") for sentence in sentences]
+    sequential = list(_iter_matches(texts, reference, 0.65, True))
+
+    repairs = []
+    match_entry = corrector._match_entry
+
+    def counting_match_entry(*args: Any, **kwargs: Any) -> MatchResult:
+        repairs.append(args[0])
+        return match_entry(*args, **kwargs)
+
+    monkeypatch.setattr(corrector, "_match_entry", counting_match_entry)
+    parallel = list(_iter_matches_parallel(texts, reference, 0.65, True, 2, False))
+
+    assert repairs
+    assert parallel == sequential
@@ -0,0 +1,78 @@
+import random
+from typing import Tuple
+
+import pytest
+
+from srt_corrector import find_text_in_reference, normalize_for_matching, normalize_reference
+from srt_corrector.matching import _LCSPattern
+
+
+def _lcs_dp(a: str, b: str) -> int:
+    row = [0] * (len(b) + 1)
+    for char in a:
+        prev_diag = 0
+        for j, other in enumerate(b, 1):
+            prev_diag, row[j] = row[j], (
+                prev_diag + 1 if char == other else max(row[j], row[j - 1])
+            )
+    return row[-1]
+
+
+def _best_prefix_sweep(pattern: _LCSPattern, other: str, min_len: int) -> Tuple[int, float]:
+    best_len, best_ratio = 0, 0.0
+    for length in range(min_len, len(other) + 1):
+        ratio = pattern.ratio(other[:length])
+        if ratio > best_ratio:
+            best_len, best_ratio = length, ratio
+    return best_len, best_ratio
+
+
+def _random_text(rng: random.Random, max_len: int) -> str:
+    return "".join(rng.choice("abc de") for _ in range(rng.randint(0, max_len)))
+
+
+def test_lcs_ratio_matches_dynamic_programming() -> None:
+    rng = random.Random(0)
+    for _ in range(500):
+        a = _random_text(rng, 90) or "a"
+        b = _random_text(rng, 90)
+        expected = 2.0 * _lcs_dp(a, b) / (len(a) + len(b))
+        assert _LCSPattern(a).ratio(b) == pytest.approx(expected)
+
+
+def test_lcs_ratio_score_cutoff_only_skips_lower_scores() -> None:
+    rng = random.Random(1)
+    for _ in range(500):
+        a = _random_text(rng, 40) or "a"
+        b = _random_text(rng, 60)
+        cutoff = rng.random()
+        pattern = _LCSPattern(a)
+        full = pattern.ratio(b)
+        cut = pattern.ratio(b, cutoff)
+        assert cut == full or (cut == 0.0 and full < cutoff)
+
+
+def test_best_prefix_matches_length_sweep() -> None:
+    rng = random.Random(2)
+    for _ in range(500):
+        pattern = _LCSPattern(_random_text(rng, 30) or "a")
+        other = _random_text(rng, 50)
+        min_len = rng.randint(0, 20)
+        assert pattern.best_prefix(other, min_len) == _best_prefix_sweep(pattern, other, min_len)
+
+
+def test_normalize_reference_matches_normalize_for_matching() -> None:
+    text = "  “Hello,” she said—twice.\n\nÉcole   über_alles 42!  "
+    reference = normalize_reference(text)
+    assert reference.normalized == normalize_for_matching(text)
+    assert len(reference.norm_to_orig) == len(reference.normalized)
+    for norm_idx, orig_idx in enumerate(reference.norm_to_orig):
+        char = reference.normalized[norm_idx]
+        assert char == " " and text[orig_idx].isspace() or text[orig_idx].lower() == char
+
+
+def test_verbatim_line_is_found_exactly() -> None:
+    reference = normalize_reference("First line here. The quick brown fox jumps. Last line.")
+    start, end, score, method = find_text_in_reference("the quick brown fox jumps", reference)
+    assert (score, method) == (1.0, "exact")
+    assert reference.normalized[start:end] == "the quick brown fox jumps"
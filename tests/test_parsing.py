@@ -0,0 +1,74 @@
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from srt_corrector import SRTEntry, iter_parse_srt, parse_srt, read_reference
+
+
+def _write(tmp_path: Path, content: str) -> str:
+    path = tmp_path / "input.srt"
+    path.write_bytes(content.encode("utf-8"))
+    return str(path)
+
+
+def test_parse_srt_basic_blocks(tmp_path: Path) -> None:
+    path = _write(
+        tmp_path,
+        "1\n00:00:01,000 --> 00:00:02,000\nHello\nworld\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nBye\n",
+    )
+    assert parse_srt(path) == [
+        SRTEntry(1, "00:00:01,000 --> 00:00:02,000", "Hello\nworld"),
+        SRTEntry(2, "00:00:03,000 --> 00:00:04,000", "Bye"),
+    ]
+
+
+def test_parse_srt_strips_bom_and_handles_missing_trailing_newline(tmp_path: Path) -> None:
+    path = _write(tmp_path, "﻿1\n00:00:01,000 --> 00:00:02,000\nHello")
+    assert parse_srt(path) == [SRTEntry(1, "00:00:01,000 --> 00:00:02,000", "Hello")]
+
+
+def test_parse_srt_keeps_blank_line_inside_text(tmp_path: Path) -> None:
+    path = _write(
+        tmp_path,
+        "1\n00:00:01,000 --> 00:00:02,000\nfirst\n\n\nsecond\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nnext\n",
+    )
+    entries = parse_srt(path)
+    assert [entry.text for entry in entries] == ["first\n\nsecond", "next"]
+
+
+def test_parse_srt_crlf_and_empty_text(tmp_path: Path) -> None:
+    path = _write(
+        tmp_path,
+        "1\r\n00:00:01,000 --> 00:00:02,000\r\n\r\n2\r\n00:00:03,000 --> 00:00:04,000\r\nx\r\n",
+    )
+    assert [(entry.index, entry.text) for entry in parse_srt(path)] == [(1, ""), (2, "x")]
+
+
+def test_iter_parse_srt_is_lazy(tmp_path: Path) -> None:
+    path = _write(tmp_path, "1\n00:00:01,000 --> 00:00:02,000\nHello\n")
+    entries = iter_parse_srt(path)
+    assert next(entries).text == "Hello"
+    assert next(entries, None) is None
+
+
+def test_read_reference_translates_newlines(tmp_path: Path) -> None:
+    path = tmp_path / "reference.txt"
+    path.write_bytes("one\r\ntwo\rthree\n".encode("utf-8"))
+    assert read_reference(str(path)) == "one\ntwo\nthree\n"
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+def test_read_reference_from_pipe(tmp_path: Path) -> None:
+    # Pipes and process substitution report st_size == 0.
+    fifo = tmp_path / "reference.fifo"
+    os.mkfifo(fifo)
+    writer = threading.Thread(target=fifo.write_text, args=("piped text\n",))
+    writer.start()
+    try:
+        assert read_reference(str(fifo)) == "piped text\n"
+    finally:
+        writer.join()
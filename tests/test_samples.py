@@ -0,0 +1,157 @@
+"""Regression spans on the bundled sample files.
+
+Candidate spans are scored with the LCS (Indel) ratio rather than
+``difflib.SequenceMatcher``. Most entries below pin output that differs
+from the original SequenceMatcher-based matcher, so further metric or
+search changes show up here. The Indel ratio does not always pick a
+better span: the truncated entries end a few words earlier than the
+original matcher did and are pinned next to the baseline output. The
+unchanged entries match the baseline and are kept because earlier
+revisions of the boundary refinement moved them.
+"""
+
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from srt_corrector import correct_srt_entries, parse_srt, read_reference
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _corrected(srt_name: str, txt_name: str) -> Dict[int, str]:
+    entries = parse_srt(str(ROOT / srt_name))
+    reference_text = read_reference(str(ROOT / txt_name))
+    return {entry.index: entry.text for entry in correct_srt_entries(entries, reference_text)}
+
+
+@pytest.fixture(scope="module")
+def raw_output() -> Dict[int, str]:
+    return _corrected("raw.srt", "original.txt")
+
+
+@pytest.fixture(scope="module")
+def raw03_output() -> Dict[int, str]:
+    return _corrected("raw03.srt", "original03.txt")
+
+
+@pytest.mark.parametrize(
+    "index, expected",
+    [
+        (
+            295,
+            "He was driving on Skyline Boulevard in the Santa Cruz Mountains with a high "
+            "school friend, Tim Brown, who looked back, saw flames coming from the engine, "
+            "and casually said to Jobs, “Pull over, your car is on fire.”",
+        ),
+    ],
+)
+def test_raw_spans(raw_output: Dict[int, str], index: int, expected: str) -> None:
+    assert raw_output[index] == expected
+
+
+@pytest.mark.parametrize(
+    "index, expected",
+    [
+        (169, "“If he’s decided that something should happen, then he’"),
+        (204, "If he had told me he needed the money, he should have known I"),
+        (
+            264,
+            "Brand ran the Whole Earth Truck Store, which began as a roving truck that sold "
+            "useful tools and educational materials, and in 1968 he decided to extend its "
+            "reach with the Whole Earth Catalog.",
+        ),
+        (
+            302,
+            "“That night, I started to sketch out on paper what would later become known as "
+            "the Apple I.”\nAt first he planned to",
+        ),
+        (
+            308,
+            "incompatible with it.\nAfter work each day, Wozniak would go home for a TV "
+            "dinner and then return to HP to moonlight on his computer.",
+        ),
+        (
+            435,
+            "It noted that in payment for his 10% of the company, he received $800, and "
+            "shortly afterward $1,500 more.\nHad he stayed on and kept",
+        ),
+        (
+            471,
+            "Allen Baum, the third prankster from Homestead High, and his father agreed to "
+            "loan them $5,000. Jobs tried",
+        ),
+        (
+            501,
+            "losing most of her house to piles of parts and houseguests, but she was "
+            "frustrated by her son’s increasingly quirky diets.",
+        ),
+    ],
+)
+def test_raw03_spans(raw03_output: Dict[int, str], index: int, expected: str) -> None:
+    assert raw03_output[index] == expected
+
+
+@pytest.mark.parametrize(
+    "index, expected, baseline",
+    [
+        (68, "Taking Jobs by the hand, he led", "Taking Jobs by the hand, he led him"),
+        (
+            214,
+            "He never did one ounce of work after 1978. And yet he got",
+            "He never did one ounce of work after 1978. And yet he got exactly",
+        ),
+        (
+            241,
+            "There was the technology revolution that began with the growth of military "
+            "contractors and soon included electronics firms, microchip makers, video game "
+            "designers,",
+            "There was the technology revolution that began with the growth of military "
+            "contractors and soon included electronics firms, microchip makers, video game "
+            "designers, and computer",
+        ),
+        (
+            350,
+            "They could sell them for $40 apiece and perhaps clear a profit of $700. "
+            "Wozniak was",
+            "They could sell them for $40 apiece and perhaps clear a profit of $700. "
+            "Wozniak was dubious",
+        ),
+    ],
+)
+def test_raw03_spans_truncated(
+    raw03_output: Dict[int, str], index: int, expected: str, baseline: str
+) -> None:
+    # Known regressions: the Indel ratio stops short of the original matcher's span.
+    assert raw03_output[index] == expected
+    assert baseline.startswith(expected)
+
+
+@pytest.mark.parametrize(
+    "output, index, expected",
+    [
+        ("raw", 259, "CHAPTER THREE\nTHE DROPOUT\n \nTurn"),
+        ("raw03", 366, "his part, Jobs sold his"),
+    ],
+)
+def test_spans_unchanged_from_baseline(
+    request: pytest.FixtureRequest, output: str, index: int, expected: str
+) -> None:
+    assert request.getfixturevalue(f"{output}_output")[index] == expected
+
+
+@pytest.mark.parametrize(
+    "index, start, end",
+    [
+        (12, "One reason Jobs was eager to make some money in early 1974", "hippie movement."),
+        (162, "Even more brazenly, he said she would", "55 miles per hour,” she recalled."),
+        (246, "Overlaid on it all were various self-fulfillment movements", "his own business."),
+    ],
+)
+def test_raw03_long_garbled_lines(
+    raw03_output: Dict[int, str], index: int, start: str, end: str
+) -> None:
+    # Long lines that SequenceMatcher's autojunk used to score below the threshold.
+    assert raw03_output[index].startswith(start)
+    assert raw03_output[index].endswith(end)